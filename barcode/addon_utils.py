@@ -6,12 +6,28 @@ used by EAN and UPC barcode classes.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from barcode.charsets.addons import ADDON2_PARITY
 from barcode.charsets.addons import ADDON5_PARITY
 from barcode.charsets.addons import ADDON_CODES
 from barcode.charsets.addons import ADDON_QUIET_ZONE
 from barcode.charsets.addons import ADDON_SEPARATOR
 from barcode.charsets.addons import ADDON_START
+from barcode.charsets.digits import DIGIT_VALUES
+from barcode.charsets.digits import is_ascii_digits
+from barcode.errors import IllegalCharacterError
+
+# Digit encodings per position for every parity pattern, precomputed from
+# ADDON_CODES so that encoding an addon needs no dict lookups
+_ADDON2_CODES = tuple(
+    tuple(ADDON_CODES[parity_char] for parity_char in parity)
+    for parity in ADDON2_PARITY
+)
+_ADDON5_CODES = tuple(
+    tuple(ADDON_CODES[parity_char] for parity_char in parity)
+    for parity in ADDON5_PARITY
+)
 
 
 def build_addon(addon: str) -> str:
@@ -19,19 +35,16 @@ def build_addon(addon: str) -> str:
 
     :param addon: The addon digits (2 or 5 digits)
     :returns: The addon pattern as string (including quiet zone separator)
+    :raises IllegalCharacterError: If the addon is not made of ASCII digits
     """
     if not addon:
         return ""
+    _check_digits(addon)
 
     # Add quiet zone (9 modules) before addon per GS1 specification
-    code = ADDON_QUIET_ZONE
-
     if len(addon) == 2:
-        code += build_addon2(addon)
-    else:
-        code += build_addon5(addon)
-
-    return code
+        return ADDON_QUIET_ZONE + ADDON2_TABLE[int(addon)]
+    return ADDON_QUIET_ZONE + _build_addon5(addon)
 
 
 def build_addon2(addon: str) -> str:
@@ -41,18 +54,10 @@ def build_addon2(addon: str) -> str:
 
     :param addon: The 2-digit addon string
     :returns: The EAN-2 addon pattern (using 'A' for addon bars)
+    :raises IllegalCharacterError: If the addon is not made of ASCII digits
     """
-    value = int(addon)
-    parity = ADDON2_PARITY[value % 4]
-
-    code = ADDON_START
-    for i, digit in enumerate(addon):
-        if i > 0:
-            code += ADDON_SEPARATOR
-        code += ADDON_CODES[parity[i]][int(digit)]
-
-    # Replace '1' with 'A' to mark addon bars for special rendering
-    return code.replace("1", "A")
+    _check_digits(addon)
+    return _build_addon2(addon)
 
 
 def build_addon5(addon: str) -> str:
@@ -62,20 +67,45 @@ def build_addon5(addon: str) -> str:
 
     :param addon: The 5-digit addon string
     :returns: The EAN-5 addon pattern (using 'A' for addon bars)
+    :raises IllegalCharacterError: If the addon is not made of ASCII digits
     """
+    _check_digits(addon)
+    return _build_addon5(addon)
+
+
+def _check_digits(addon: str) -> None:
+    if not is_ascii_digits(addon):
+        raise IllegalCharacterError(f"Addon can only contain numbers, got {addon}.")
+
+
+def _build_addon2(addon: str) -> str:
+    """Encode a 2-digit addon that has already been validated."""
+    value = int(addon)
+    codes = _ADDON2_CODES[value % 4]
+
+    return _encode_addon(addon.encode("ascii").translate(DIGIT_VALUES), codes)
+
+
+@lru_cache(maxsize=4096)
+def _build_addon5(addon: str) -> str:
+    """Encode a 5-digit addon that has already been validated."""
     # Calculate checksum for parity pattern
-    checksum = 0
-    for i, digit in enumerate(addon):
-        weight = 3 if i % 2 == 0 else 9
-        checksum += int(digit) * weight
-    checksum %= 10
-    parity = ADDON5_PARITY[checksum]
-
-    code = ADDON_START
-    for i, digit in enumerate(addon):
-        if i > 0:
-            code += ADDON_SEPARATOR
-        code += ADDON_CODES[parity[i]][int(digit)]
+    digits = addon.encode("ascii").translate(DIGIT_VALUES)
+    checksum = (sum(digits[::2]) * 3 + sum(digits[1::2]) * 9) % 10
+    codes = _ADDON5_CODES[checksum]
+
+    return _encode_addon(digits, codes)
+
+
+def _encode_addon(digits: bytes, codes: tuple[tuple[str, ...], ...]) -> str:
+    """Encode addon digit values using the per-position digit encodings."""
+    code = ADDON_START + ADDON_SEPARATOR.join(
+        position[digit] for position, digit in zip(codes, digits)
+    )
 
     # Replace '1' with 'A' to mark addon bars for special rendering
     return code.replace("1", "A")
+
+
+# All 100 possible EAN-2 patterns, indexed by their numeric value
+ADDON2_TABLE = tuple(_build_addon2(f"{value:02d}") for value in range(100))
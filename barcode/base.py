@@ -31,7 +31,21 @@ class Barcode:
         "text": "",
     }
 
-    writer: BaseWriter
+    _writer: BaseWriter | None = None
+
+    @property
+    def writer(self) -> BaseWriter:
+        """The writer used to render this barcode.
+
+        If none was given, an instance of `default_writer` is created on first use,
+        so barcodes that are never rendered don't pay for one."""
+        if self._writer is None:
+            self._writer = self.default_writer()
+        return self._writer
+
+    @writer.setter
+    def writer(self, writer: BaseWriter | None) -> None:
+        self._writer = writer
 
     def __init__(self, code: str, writer: BaseWriter | None = None, **options) -> None:
         raise NotImplementedError
@@ -0,0 +1,15 @@
+"""Digit values shared by the numeric barcode types."""
+
+from __future__ import annotations
+
+# Maps ASCII digits to their numeric value, for use with bytes.translate()
+DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+def is_ascii_digits(code: str) -> bool:
+    """Tells whether `code` is non-empty and made of ASCII digits only.
+
+    Unlike ``str.isdigit()``, this rejects other Unicode digits, such as
+    Arabic-Indic digits, which ``DIGIT_VALUES`` does not map.
+    """
+    return code.isascii() and code.isdigit()
@@ -10,6 +10,9 @@ from barcode.charsets.addons import ADDON_START
 # same A/B digit encodings as CODES["A"] and CODES["B"] defined below.
 EDGE = "101"
 MIDDLE = "01010"
+# Guard patterns with the bars marked as longer guard bars
+GUARD_EDGE = EDGE.replace("1", "G")
+GUARD_MIDDLE = MIDDLE.replace("1", "G")
 CODES = {
     "A": (
         "0001101",
@@ -61,6 +64,12 @@ LEFT_PATTERN = (
     "ABBABA",
 )
 
+# Left-half digit encodings, precomputed from CODES and LEFT_PATTERN and indexed
+# by the first digit, then by position and digit
+LEFT_TABLE = tuple(
+    tuple(CODES[parity] for parity in pattern) for pattern in LEFT_PATTERN
+)
+
 # Re-export addon constants for backwards compatibility
 __all__ = [
     "ADDON2_PARITY",
@@ -70,6 +79,9 @@ __all__ = [
     "ADDON_START",
     "CODES",
     "EDGE",
+    "GUARD_EDGE",
+    "GUARD_MIDDLE",
     "LEFT_PATTERN",
+    "LEFT_TABLE",
     "MIDDLE",
 ]
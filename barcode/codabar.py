@@ -32,7 +32,7 @@ class CODABAR(Barcode):
 
     def __init__(self, code, writer=None, narrow=2, wide=5) -> None:
         self.code = code
-        self.writer = writer or self.default_writer()
+        self.writer = writer
         self.narrow = narrow
         self.wide = wide
 
@@ -18,8 +18,6 @@ from barcode.errors import NumberOfDigitsError
 if TYPE_CHECKING:
     from collections.abc import Collection
 
-    from barcode.writer import BaseWriter
-
 __docformat__ = "restructuredtext en"
 
 # Sizes
@@ -56,7 +54,7 @@ class Code39(Barcode):
         self.code = code.upper()
         if add_checksum:
             self.code += self.calculate_checksum()
-        self.writer = writer or self.default_writer()
+        self.writer = writer
         check_code(self.code, self.name, code39.REF)
 
     def __str__(self) -> str:
@@ -147,12 +145,11 @@ class Code128(Barcode):
     name = "Code 128"
     _charset: Literal["A", "B", "C"]
     code: str
-    writer: BaseWriter
     buffer: str
 
     def __init__(self, code: str, writer=None) -> None:
         self.code = code
-        self.writer = writer or self.default_writer()
+        self.writer = writer
         self._charset = "C"
         self._digit_buffer = ""  # Accumulate pairs of digits for charset C
         check_code(self.code, self.name, code128.ALL)
@@ -7,10 +7,13 @@ from __future__ import annotations
 
 __docformat__ = "restructuredtext en"
 
+from functools import lru_cache
 
 from barcode import addon_utils
 from barcode.base import Barcode
 from barcode.charsets import ean as _ean
+from barcode.charsets.digits import DIGIT_VALUES
+from barcode.charsets.digits import is_ascii_digits
 from barcode.errors import IllegalCharacterError
 from barcode.errors import NumberOfDigitsError
 from barcode.errors import WrongCountryCodeError
@@ -29,6 +32,39 @@ SIZES = {
     "SC9": 0.66,
 }
 
+# Maps guard bars and bars to "|" and spaces to " ", for to_ascii()
+_ASCII_BARS = str.maketrans("G10", "|| ")
+
+
+@lru_cache(maxsize=4096)
+def _build_ean13(ean: str, edge: str, middle: str, addon: str) -> str:
+    """Assembles the EAN-13 pattern for `ean`, followed by the `addon` pattern."""
+    digits = ean.encode("ascii").translate(DIGIT_VALUES)
+    parts = [edge]
+    left = _ean.LEFT_TABLE[digits[0]]
+    parts.extend(codes[digit] for codes, digit in zip(left, digits[1:7]))
+    parts.append(middle)
+    right = _ean.CODES["C"]
+    parts.extend(right[digit] for digit in digits[7:])
+    parts.append(edge)
+    parts.append(addon_utils.build_addon(addon))
+    return "".join(parts)
+
+
+@lru_cache(maxsize=4096)
+def _build_ean8(ean: str, edge: str, middle: str, addon: str) -> str:
+    """Assembles the EAN-8 pattern for `ean`, followed by the `addon` pattern."""
+    digits = ean.encode("ascii").translate(DIGIT_VALUES)
+    parts = [edge]
+    left = _ean.CODES["A"]
+    parts.extend(left[digit] for digit in digits[:4])
+    parts.append(middle)
+    right = _ean.CODES["C"]
+    parts.extend(right[digit] for digit in digits[4:])
+    parts.append(edge)
+    parts.append(addon_utils.build_addon(addon))
+    return "".join(parts)
+
 
 class EuropeanArticleNumber13(Barcode):
     """Initializes EAN13 object.
@@ -52,7 +88,8 @@ class EuropeanArticleNumber13(Barcode):
         guardbar: bool = False,
         addon: str | None = None,
     ) -> None:
-        if not ean[: self.digits].isdigit():
+        base = ean[: self.digits]
+        if not is_ascii_digits(base):
             raise IllegalCharacterError(f"EAN code can only contain numbers {ean}.")
 
         if len(ean) < self.digits:
@@ -60,15 +97,17 @@ class EuropeanArticleNumber13(Barcode):
                 f"EAN must have {self.digits} digits, received {len(ean)}."
             )
 
-        base = ean[: self.digits]
         if no_checksum:
             # Use the thirteenth digit if given in parameter, otherwise pad with zero
-            if len(ean) > self.digits and ean[self.digits].isdigit():
-                last = int(ean[self.digits])
-            else:
+            last_digit = ean[self.digits : self.digits + 1]
+            if not last_digit.isdigit():
                 last = 0
+            elif is_ascii_digits(last_digit):
+                last = int(last_digit)
+            else:
+                raise IllegalCharacterError(f"EAN code can only contain numbers {ean}.")
         else:
-            last = self.calculate_checksum(base)
+            last = self._checksum(base.encode("ascii").translate(DIGIT_VALUES))
 
         self.ean = f"{base}{last}"
 
@@ -77,7 +116,7 @@ class EuropeanArticleNumber13(Barcode):
         if addon is not None:
             addon = addon.strip()
             if addon:
-                if not addon.isdigit():
+                if not is_ascii_digits(addon):
                     raise IllegalCharacterError(
                         f"Addon can only contain numbers, got {addon}."
                     )
@@ -89,12 +128,12 @@ class EuropeanArticleNumber13(Barcode):
 
         self.guardbar = guardbar
         if guardbar:
-            self.EDGE = _ean.EDGE.replace("1", "G")
-            self.MIDDLE = _ean.MIDDLE.replace("1", "G")
+            self.EDGE = _ean.GUARD_EDGE
+            self.MIDDLE = _ean.GUARD_MIDDLE
         else:
             self.EDGE = _ean.EDGE
             self.MIDDLE = _ean.MIDDLE
-        self.writer = writer or self.default_writer()
+        self.writer = writer
 
     def __str__(self) -> str:
         if self.addon:
@@ -112,13 +151,25 @@ class EuropeanArticleNumber13(Barcode):
 
         Calculates the checksum for the supplied `value` (if any) or for this barcode's
         internal ``self.ean`` property.
+
+        :raises IllegalCharacterError: If `value` is not made of ASCII digits.
         """
 
         ean_without_checksum = value or self.ean[: self.digits]
+        if not is_ascii_digits(ean_without_checksum):
+            raise IllegalCharacterError(
+                f"EAN code can only contain numbers {ean_without_checksum}."
+            )
+        return self._checksum(
+            ean_without_checksum.encode("ascii").translate(DIGIT_VALUES)
+        )
 
-        evensum = sum(int(x) for x in ean_without_checksum[-2::-2])
-        oddsum = sum(int(x) for x in ean_without_checksum[-1::-2])
-        return (10 - ((evensum + oddsum * 3) % 10)) % 10
+    def _checksum(self, digits: bytes) -> int:
+        """Calculates the EAN-13 checksum from the values of the digits."""
+        evensum = sum(digits[-2::-2])
+        oddsum = sum(digits[-1::-2])
+        # The check digit tops the weighted sum up to the next multiple of 10
+        return -(evensum + oddsum * 3) % 10
 
     def build(self) -> list[str]:
         """Builds the barcode pattern from `self.ean`.
@@ -126,27 +177,7 @@ class EuropeanArticleNumber13(Barcode):
         :returns: The pattern as string
         :rtype: List containing the string as a single element
         """
-        code = self.EDGE[:]
-        pattern = _ean.LEFT_PATTERN[int(self.ean[0])]
-        for i, number in enumerate(self.ean[1:7]):
-            code += _ean.CODES[pattern[i]][int(number)]
-        code += self.MIDDLE
-        for number in self.ean[7:]:
-            code += _ean.CODES["C"][int(number)]
-        code += self.EDGE
-
-        # Add addon if present
-        if self.addon:
-            code += self._build_addon()
-
-        return [code]
-
-    def _build_addon(self) -> str:
-        """Builds the addon barcode pattern (EAN-2 or EAN-5).
-
-        :returns: The addon pattern as string (including quiet zone separator)
-        """
-        return addon_utils.build_addon(self.addon or "")
+        return [_build_ean13(self.ean, self.EDGE, self.MIDDLE, self.addon or "")]
 
     def to_ascii(self) -> str:
         """Returns an ascii representation of the barcode.
@@ -157,7 +188,7 @@ class EuropeanArticleNumber13(Barcode):
         if not len(code_list) == 1:
             raise RuntimeError("Code list must contain a single element.")
         code = code_list[0]
-        return code.replace("G", "|").replace("1", "|").replace("0", " ")
+        return code.translate(_ASCII_BARS)
 
     def render(self, writer_options: dict | None = None, text: str | None = None):
         options = {"module_width": SIZES["SC2"]}
@@ -215,19 +246,7 @@ class EuropeanArticleNumber8(EuropeanArticleNumber13):
 
         :returns: A list containing the string as a single element
         """
-        code = self.EDGE[:]
-        for number in self.ean[:4]:
-            code += _ean.CODES["A"][int(number)]
-        code += self.MIDDLE
-        for number in self.ean[4:]:
-            code += _ean.CODES["C"][int(number)]
-        code += self.EDGE
-
-        # Add addon if present
-        if self.addon:
-            code += self._build_addon()
-
-        return [code]
+        return [_build_ean8(self.ean, self.EDGE, self.MIDDLE, self.addon or "")]
 
     def get_fullcode(self):
         addon = "" if not self.addon else f" {self.addon}"
@@ -263,18 +282,11 @@ class EuropeanArticleNumber14(EuropeanArticleNumber13):
     name = "EAN-14"
     digits = 13
 
-    def calculate_checksum(self, value: str | None = None) -> int:
-        """Calculates and returns the checksum for EAN14-Code.
-
-        Calculates the checksum for the supplied `value` (if any) or for this barcode's
-        internal ``self.ean`` property.
-        """
-
-        ean_without_checksum = value or self.ean[: self.digits]
-
-        evensum = sum(int(x) for x in ean_without_checksum[::2])
-        oddsum = sum(int(x) for x in ean_without_checksum[1::2])
-        return (10 - (((evensum * 3) + oddsum) % 10)) % 10
+    def _checksum(self, digits: bytes) -> int:
+        """Calculates the EAN-14 checksum from the values of the digits."""
+        evensum = sum(digits[::2])
+        oddsum = sum(digits[1::2])
+        return -(evensum * 3 + oddsum) % 10
 
 
 # Shortcuts
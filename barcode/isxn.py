@@ -24,11 +24,20 @@ Example::
 
 from __future__ import annotations
 
+from operator import mul
+
+from barcode.charsets.digits import DIGIT_VALUES
+from barcode.charsets.digits import is_ascii_digits
 from barcode.ean import EuropeanArticleNumber13
+from barcode.errors import IllegalCharacterError
 from barcode.errors import WrongCountryCodeError
 
 __docformat__ = "restructuredtext en"
 
+# Check digit weights for the first 9 ISBN-10 digits and 7 ISSN digits
+_ISBN10_WEIGHTS = (1, 2, 3, 4, 5, 6, 7, 8, 9)
+_ISSN_WEIGHTS = (8, 7, 6, 5, 4, 3, 2)
+
 
 class InternationalStandardBookNumber13(EuropeanArticleNumber13):
     """Initializes new ISBN-13 barcode.
@@ -81,7 +90,8 @@ class InternationalStandardBookNumber10(InternationalStandardBookNumber13):
         self.isbn10 = f"{isbn}{self._calculate_checksum()}"
 
     def _calculate_checksum(self):
-        tmp = sum(x * int(y) for x, y in enumerate(self.isbn10[:9], start=1)) % 11
+        digits = self.isbn10[:9].encode("ascii").translate(DIGIT_VALUES)
+        tmp = sum(map(mul, _ISBN10_WEIGHTS, digits)) % 11
         if tmp == 10:
             return "X"
 
@@ -125,16 +135,15 @@ class InternationalStandardSerialNumber(EuropeanArticleNumber13):
         else:
             self._sequence_digits = "00"
             issn = issn[: self.issn_digits]
+        if not is_ascii_digits(issn):
+            raise IllegalCharacterError(f"ISSN can only contain numbers {issn}.")
         self.issn = issn
         self.issn = f"{issn}{self._calculate_checksum()}"
         super().__init__(self.make_ean(), writer, addon=addon)
 
     def _calculate_checksum(self):
-        tmp = (
-            11
-            - sum(x * int(y) for x, y in enumerate(reversed(self.issn[:7]), start=2))
-            % 11
-        )
+        digits = self.issn[:7].encode("ascii").translate(DIGIT_VALUES)
+        tmp = 11 - sum(map(mul, _ISSN_WEIGHTS, digits)) % 11
         if tmp == 10:
             return "X"
 
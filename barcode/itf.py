@@ -39,7 +39,7 @@ class ITF(Barcode):
         if len(code) % 2 != 0:
             code = "0" + code
         self.code = code
-        self.writer = writer or self.default_writer()
+        self.writer = writer
         self.narrow = narrow
         self.wide = wide
 
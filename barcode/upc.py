@@ -7,14 +7,34 @@ from __future__ import annotations
 
 __docformat__ = "restructuredtext en"
 
-from functools import reduce
+from functools import lru_cache
 
 from barcode import addon_utils
 from barcode.base import Barcode
 from barcode.charsets import upc as _upc
+from barcode.charsets.digits import DIGIT_VALUES
+from barcode.charsets.digits import is_ascii_digits
 from barcode.errors import IllegalCharacterError
 from barcode.errors import NumberOfDigitsError
 
+# Maps bars to "|" and spaces to "_", for to_ascii()
+_ASCII_BARS = str.maketrans("10", "|_")
+
+
+@lru_cache(maxsize=4096)
+def _build_upca(upc: str, addon: str) -> str:
+    """Assembles the UPC-A pattern for `upc`, followed by the `addon` pattern."""
+    digits = upc.encode("ascii").translate(DIGIT_VALUES)
+    parts = [_upc.EDGE]
+    left = _upc.CODES["L"]
+    parts.extend(left[digit] for digit in digits[0:6])
+    parts.append(_upc.MIDDLE)
+    right = _upc.CODES["R"]
+    parts.extend(right[digit] for digit in digits[6:])
+    parts.append(_upc.EDGE)
+    parts.append(addon_utils.build_addon(addon))
+    return "".join(parts)
+
 
 class UniversalProductCodeA(Barcode):
     """Universal Product Code (UPC) barcode.
@@ -45,7 +65,7 @@ class UniversalProductCodeA(Barcode):
         """
         self.ean = make_ean
         upc = upc[: self.digits]
-        if not upc.isdigit():
+        if not is_ascii_digits(upc):
             raise IllegalCharacterError("UPC code can only contain numbers.")
         if len(upc) != self.digits:
             raise NumberOfDigitsError(
@@ -59,7 +79,7 @@ class UniversalProductCodeA(Barcode):
         if addon is not None:
             addon = addon.strip()
             if addon:
-                if not addon.isdigit():
+                if not is_ascii_digits(addon):
                     raise IllegalCharacterError(
                         f"Addon can only contain numbers, got {addon}."
                     )
@@ -69,7 +89,7 @@ class UniversalProductCodeA(Barcode):
                     )
                 self.addon = addon
 
-        self.writer = writer or self.default_writer()
+        self.writer = writer
 
     def __str__(self) -> str:
         base = "0" + self.upc if self.ean else self.upc
@@ -90,17 +110,10 @@ class UniversalProductCodeA(Barcode):
         :rtype: int
         """
 
-        def sum_(x, y):
-            return int(x) + int(y)
-
-        upc = self.upc[0 : self.digits]
-        oddsum = reduce(sum_, upc[::2])
-        evensum = reduce(sum_, upc[1::2])
-        check = (evensum + oddsum * 3) % 10
-        if check == 0:
-            return 0
-
-        return 10 - check
+        upc = self.upc[0 : self.digits].encode("ascii").translate(DIGIT_VALUES)
+        oddsum = sum(upc[::2])
+        evensum = sum(upc[1::2])
+        return -(evensum + oddsum * 3) % 10
 
     def build(self) -> list[str]:
         """Builds the barcode pattern from 'self.upc'
@@ -108,30 +121,7 @@ class UniversalProductCodeA(Barcode):
         :return: The pattern as string
         :rtype: List containing the string as a single element
         """
-        code = _upc.EDGE[:]
-
-        for number in self.upc[0:6]:
-            code += _upc.CODES["L"][int(number)]
-
-        code += _upc.MIDDLE
-
-        for number in self.upc[6:]:
-            code += _upc.CODES["R"][int(number)]
-
-        code += _upc.EDGE
-
-        # Add addon if present
-        if self.addon:
-            code += self._build_addon()
-
-        return [code]
-
-    def _build_addon(self) -> str:
-        """Builds the addon barcode pattern (EAN-2 or EAN-5).
-
-        :returns: The addon pattern as string (including quiet zone separator)
-        """
-        return addon_utils.build_addon(self.addon or "")
+        return [_build_upca(self.upc, self.addon or "")]
 
     def to_ascii(self) -> str:
         """Returns an ascii representation of the barcode.
@@ -143,7 +133,7 @@ class UniversalProductCodeA(Barcode):
         if len(code_list) != 1:
             raise RuntimeError("Code list must contain a single element.")
         code = code_list[0]
-        return code.replace("1", "|").replace("0", "_")
+        return code.translate(_ASCII_BARS)
 
     def render(self, writer_options=None, text=None):
         options = {"module_width": 0.33}
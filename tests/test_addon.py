@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from html import unescape
-from io import BytesIO
+from typing import NamedTuple
 
 import pytest
 
 from barcode import get_barcode
+from barcode.addon_utils import build_addon
+from barcode.addon_utils import build_addon5
 from barcode.ean import EAN8
 from barcode.ean import EAN13
 from barcode.errors import IllegalCharacterError
@@ -17,29 +20,38 @@ from barcode.isxn import ISSN
 from barcode.upc import UPCA
 from barcode.writer import SVGWriter
 
+_TEXT_XY_RE = re.compile(
+    r'<text\s+x="([^"m]+)(?:mm)?"\s+y="([^"m]+)(?:mm)?"[^>]*>([^<]*)</text>'
+)
 
-def _extract_text_elements(svg: str) -> list[dict[str, float | str]]:
+
+class _TextElement(NamedTuple):
+    x: float
+    y: float
+    text: str
+
+
+def _extract_text_elements(svg: str) -> list[_TextElement]:
     """Extract text elements with their content, x, and y positions from SVG."""
-    pattern = r'<text\s+x="([^"]+)"\s+y="([^"]+)"[^>]*>(.*?)</text>'
-    matches = re.findall(pattern, svg)
-    result: list[dict[str, float | str]] = []
-    for x, y, content in matches:
-        result.append(
-            {
-                "x": float(x.replace("mm", "")),
-                "y": float(y.replace("mm", "")),
-                "text": unescape(content),
-            }
-        )
-    return result
+    if "<text" not in svg:
+        return []
+    return [
+        _TextElement(float(x), float(y), unescape(content))
+        for x, y, content in _TEXT_XY_RE.findall(svg)
+    ]
 
 
+@lru_cache(maxsize=64)
 def _render_svg(ean_code: str, addon: str, guardbar: bool = True) -> str:
     """Render EAN13 barcode with given addon to SVG string."""
     ean = EAN13(ean_code, writer=SVGWriter(), guardbar=guardbar, addon=addon)
-    out = BytesIO()
-    ean.write(out, options={"write_text": True})
-    return out.getvalue().decode("utf-8")
+    return ean.render({"write_text": True}).decode("utf-8")
+
+
+@pytest.fixture
+def text_elements(code: str, addon: str) -> list[_TextElement]:
+    """Text elements of the EAN13 SVG for the parametrized code and addon."""
+    return _extract_text_elements(_render_svg(code, addon))
 
 
 class TestEAN2Addon:
@@ -68,18 +80,19 @@ class TestEAN2Addon:
         # Addon should be appended
         assert "1011" in code  # Addon start guard
 
-    def test_addon2_parity_mod4(self) -> None:
+    @pytest.mark.parametrize(
+        "addon",
+        [
+            "00",  # 0 % 4 = 0 -> AA
+            "01",  # 1 % 4 = 1 -> AB
+            "02",  # 2 % 4 = 2 -> BA
+            "03",  # 3 % 4 = 3 -> BB
+        ],
+    )
+    def test_addon2_parity_mod4(self, addon: str) -> None:
         """Test EAN-2 parity patterns based on value mod 4."""
-        # Test different mod 4 values
-        ean00 = EAN13("5901234123457", addon="00")  # 0 % 4 = 0 -> AA
-        ean01 = EAN13("5901234123457", addon="01")  # 1 % 4 = 1 -> AB
-        ean02 = EAN13("5901234123457", addon="02")  # 2 % 4 = 2 -> BA
-        ean03 = EAN13("5901234123457", addon="03")  # 3 % 4 = 3 -> BB
-
-        # Each should build without error
-        for ean in [ean00, ean01, ean02, ean03]:
-            code = ean.build()[0]
-            assert len(code) > 95  # Main EAN-13 + addon
+        code = EAN13("5901234123457", addon=addon).build()[0]
+        assert len(code) > 95  # Main EAN-13 + addon
 
 
 class TestEAN5Addon:
@@ -107,6 +120,13 @@ class TestEAN5Addon:
         # Addon should be appended
         assert "1011" in code  # Addon start guard
 
+    def test_addon5_parity_from_checksum(self) -> None:
+        """Test EAN-5 parity pattern derived from the weighted checksum."""
+        # 5*3 + 2*9 + 4*3 + 9*9 + 5*3 = 141 -> 1 -> BABAA
+        assert build_addon5("52495") == (
+            "A0AA0AAA00A0A00A00AA0A00AAA0A0A000A0AA0A0AA000A"
+        )
+
     def test_addon5_price_encoding(self) -> None:
         """Test EAN-5 with typical price encoding (e.g., $24.95)."""
         # 52495 typically means $24.95 USD (5 = USD, 2495 = price)
@@ -122,16 +142,32 @@ class TestAddonValidation:
         with pytest.raises(IllegalCharacterError):
             EAN13("5901234123457", addon="1A")
 
-    def test_addon_must_be_2_or_5_digits(self) -> None:
+    def test_addon_must_be_ascii_digits(self) -> None:
+        """Test that non-ASCII digits are rejected in addons."""
+        with pytest.raises(IllegalCharacterError):
+            EAN13("5901234123457", addon="\u0661\u0662")  # ARABIC-INDIC ONE, TWO
+        with pytest.raises(IllegalCharacterError):
+            UPCA("01234567890", addon="\u0661\u0662")
+
+    @pytest.mark.parametrize(
+        "addon",
+        [
+            "1a",
+            "1234a",
+            "\x01\x02\x03\x04\x05",
+            "\u0661\u0662",  # ARABIC-INDIC DIGITS ONE, TWO
+        ],
+    )
+    def test_build_addon_rejects_non_digits(self, addon: str) -> None:
+        """Test that build_addon itself rejects addons with non-digits."""
+        with pytest.raises(IllegalCharacterError):
+            build_addon(addon)
+
+    @pytest.mark.parametrize("addon", ["1", "123", "1234", "123456"])
+    def test_addon_must_be_2_or_5_digits(self, addon: str) -> None:
         """Test that addon must be exactly 2 or 5 digits."""
         with pytest.raises(NumberOfDigitsError):
-            EAN13("5901234123457", addon="1")
-        with pytest.raises(NumberOfDigitsError):
-            EAN13("5901234123457", addon="123")
-        with pytest.raises(NumberOfDigitsError):
-            EAN13("5901234123457", addon="1234")
-        with pytest.raises(NumberOfDigitsError):
-            EAN13("5901234123457", addon="123456")
+            EAN13("5901234123457", addon=addon)
 
     def test_addon_empty_string_ignored(self) -> None:
         """Test that empty addon string is treated as no addon."""
@@ -243,16 +279,11 @@ class TestUPCAWithAddon:
         with pytest.raises(IllegalCharacterError):
             UPCA("01234567890", addon="1A")
 
-    def test_upca_addon_must_be_2_or_5_digits(self) -> None:
+    @pytest.mark.parametrize("addon", ["1", "123", "1234", "123456"])
+    def test_upca_addon_must_be_2_or_5_digits(self, addon: str) -> None:
         """Test that UPC-A addon must be exactly 2 or 5 digits."""
         with pytest.raises(NumberOfDigitsError):
-            UPCA("01234567890", addon="1")
-        with pytest.raises(NumberOfDigitsError):
-            UPCA("01234567890", addon="123")
-        with pytest.raises(NumberOfDigitsError):
-            UPCA("01234567890", addon="1234")
-        with pytest.raises(NumberOfDigitsError):
-            UPCA("01234567890", addon="123456")
+            UPCA("01234567890", addon=addon)
 
     def test_upca_addon_empty_string_ignored(self) -> None:
         """Test that empty addon string is treated as no addon."""
@@ -302,9 +333,9 @@ class TestGTINCompliantAddonLayout:
         elements = _extract_text_elements(svg)
 
         # Last two elements are addon and '>'
-        addon_y = float(elements[-2]["y"])
-        marker_y = float(elements[-1]["y"])
-        main_y = float(elements[0]["y"])
+        addon_y = elements[-2].y
+        marker_y = elements[-1].y
+        main_y = elements[0].y
 
         assert addon_y == marker_y, (
             f"Addon and marker must share y position: "
@@ -322,8 +353,8 @@ class TestGTINCompliantAddonLayout:
         svg = _render_svg("5901234123457", "12")
         elements = _extract_text_elements(svg)
 
-        addon_x = float(elements[-2]["x"])
-        marker_x = float(elements[-1]["x"])
+        addon_x = elements[-2].x
+        marker_x = elements[-1].x
 
         # Marker should be to the right (higher x value)
         assert marker_x > addon_x, (
@@ -340,8 +371,8 @@ class TestGTINCompliantAddonLayout:
         elements5 = _extract_text_elements(svg5)
 
         # Calculate spacing: marker_x - addon_x
-        spacing2 = float(elements2[-1]["x"]) - float(elements2[-2]["x"])
-        spacing5 = float(elements5[-1]["x"]) - float(elements5[-2]["x"])
+        spacing2 = elements2[-1].x - elements2[-2].x
+        spacing5 = elements5[-1].x - elements5[-2].x
 
         # EAN-5 spacing should be roughly 2.5x EAN-2 (5 chars vs 2 chars)
         ratio = spacing5 / spacing2
@@ -358,11 +389,12 @@ class TestGTINCompliantAddonLayout:
             ("9780132354189", "51995"),
         ],
     )
-    def test_various_ean_addon_combinations(self, code: str, addon: str) -> None:
+    def test_various_ean_addon_combinations(
+        self, text_elements: list[_TextElement], addon: str
+    ) -> None:
         """Various EAN+addon combinations must follow GTIN layout
         rules."""
-        svg = _render_svg(code, addon)
-        texts = [unescape(t) for t in re.findall(r"<text[^>]*>(.*?)</text>", svg)]
+        texts = [element.text for element in text_elements]
 
         # Always: 3 main blocks + addon + '>'
         assert len(texts) == 5
@@ -370,9 +402,8 @@ class TestGTINCompliantAddonLayout:
         assert texts[-1] == ">"
 
         # Verify vertical alignment
-        elements = _extract_text_elements(svg)
-        assert float(elements[-2]["y"]) == float(elements[-1]["y"])
-        assert float(elements[-2]["y"]) < float(elements[0]["y"])
+        assert text_elements[-2].y == text_elements[-1].y
+        assert text_elements[-2].y < text_elements[0].y
 
 
 class TestEAN8WithGuardbarAddon:
@@ -382,11 +413,9 @@ class TestEAN8WithGuardbarAddon:
     def test_ean8_guardbar_addon_text_order(self) -> None:
         """EAN-8 with guardbar and addon: proper text order."""
         ean = EAN8("40267708", writer=SVGWriter(), guardbar=True, addon="12")
-        out = BytesIO()
-        ean.write(out, options={"write_text": True})
-        svg = out.getvalue().decode("utf-8")
+        svg = ean.render({"write_text": True}).decode("utf-8")
 
-        texts = [unescape(t) for t in re.findall(r"<text[^>]*>(.*?)</text>", svg)]
+        texts = [element.text for element in _extract_text_elements(svg)]
 
         # EAN-8: "<" + 2 main blocks + addon + '>'
         assert len(texts) == 5
@@ -15,3 +15,13 @@ def test_ean8_builds_with_longer_bars() -> None:
     ean = get_barcode("ean8", "40267708", options={"guardbar": True})
     bc = ean.build()
     assert ref == bc[0]
+
+
+def test_ean13_builds() -> None:
+    ref = (
+        "10100010110100111011001100100110111101001110101010110011011011001000010101"
+        "110010011101000100101"
+    )
+    ean = get_barcode("ean13", "5901234123457")
+    bc = ean.build()
+    assert ref == bc[0]
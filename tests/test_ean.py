@@ -5,6 +5,8 @@ import sys
 import pytest
 
 from barcode.ean import EAN13
+from barcode.errors import IllegalCharacterError
+from barcode.upc import UPCA
 
 
 def test_ean_checksum_generated() -> None:
@@ -51,3 +53,24 @@ def test_ean_checksum_supplied_placeholder() -> None:
 
     with open("/dev/null", "wb") as f:
         ean.write(f)
+
+
+def test_ean_rejects_non_ascii_digits() -> None:
+    with pytest.raises(IllegalCharacterError):
+        EAN13("\u0665901234123457")  # ARABIC-INDIC DIGIT FIVE
+
+
+def test_ean_checksum_rejects_non_digits() -> None:
+    ean = EAN13("842167143322")
+    with pytest.raises(IllegalCharacterError):
+        ean.calculate_checksum("12a")
+
+
+def test_upca_rejects_non_ascii_digits() -> None:
+    with pytest.raises(IllegalCharacterError):
+        UPCA("\u066112345678901")  # ARABIC-INDIC DIGIT ONE
+
+
+def test_ean_supplied_checksum_rejects_non_ascii_digit() -> None:
+    with pytest.raises(IllegalCharacterError):
+        EAN13("590123412345\u0665", no_checksum=True)  # ARABIC-INDIC DIGIT FIVE
@@ -49,3 +49,15 @@ def test_saving_svg_to_byteio_with_guardbar() -> None:
 
     with open(f"{TESTPATH}/somefile_guardbar.svg", "wb") as f:
         EAN13("100000011111", writer=SVGWriter(), guardbar=True).write(f)
+
+
+def test_default_writer_created_on_first_use() -> None:
+    ean = EAN13("100000011111")
+    assert ean._writer is None
+    assert isinstance(ean.writer, SVGWriter)
+    assert ean.writer is ean.writer
+
+
+def test_given_writer_is_used() -> None:
+    writer = SVGWriter()
+    assert EAN13("100000011111", writer=writer).writer is writer